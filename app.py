@@ -1,13 +1,19 @@
 import streamlit as st
-import gspread
-from google.oauth2.service_account import Credentials
-import pandas as pd
+import streamlit.components.v1 as components
 import uuid
 import random
 import time
 import os
+import threading
+import queue
+import csv
 from datetime import datetime
 
+# gspread and google-auth are imported lazily in load_client() so the
+# first page render does not pay for them. Taken as early as possible so the
+# startup report below covers (almost) the whole first script run.
+SCRIPT_START = time.perf_counter()
+
 # Mock Tweets for the experiment
 # In a real app, load this from a CSV or database
 TWEETS = [
@@ -33,16 +39,76 @@ TWEETS = [
     {"id": 20, "text": "Of course that dumbass was a woman.", "ai_suggestion": "Block"},
 ]
 
+# Study definitions served by this process, picked with ?study=<name>.
+# Each study has its own stimulus set, condition set and spreadsheet:
+# * "tweets": a list like TWEETS, or a path to a CSV with id,text,ai_suggestion columns
+#   (relative paths are resolved from this file's directory)
+# * "conditions": the condition letters to randomize between (any of A, B, C)
+# * "spreadsheet": the key holding the sheet URL in the [connections.gsheets] secrets
+# * "writes_per_minute" (optional): this study's share of the service account's Sheets quota
+DEFAULT_STUDY = "main"
+SUPPORTED_CONDITIONS = ('A', 'B', 'C')
+STUDIES = {
+    "main": {
+        "tweets": TWEETS,
+        "conditions": ['A', 'B', 'C'],
+        "spreadsheet": "spreadsheet",
+    },
+}
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Reject/Approve buttons rendered in the browser so the decision can be timed client-side
+# (see components/decision_buttons/index.html). Plain HTML, no build step needed.
+_decision_buttons = components.declare_component(
+    "decision_buttons",
+    path=os.path.join(APP_DIR, "components", "decision_buttons")
+)
+
 # --- HELPER FUNCTIONS ---
 
+@st.cache_resource(show_spinner=False)
+def load_corpus(path):
+    """Reads a stimulus CSV once per process; the result is shared read-only by all sessions."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple(
+            {"id": int(row["id"]), "text": row["text"], "ai_suggestion": row["ai_suggestion"]}
+            for row in csv.DictReader(f)
+        )
+
+def get_study():
+    """Returns the study definition this session belongs to."""
+    return STUDIES[st.session_state.study]
+
+def get_tweets():
+    """Returns the stimulus set of the current study."""
+    tweets = get_study()["tweets"]
+    if isinstance(tweets, str):
+        return load_corpus(os.path.join(APP_DIR, tweets))
+    return tweets
+
 def init_session_state():
     """Initialize all session state variables."""
+    if 'study' not in st.session_state:
+        # Picked once per session so a participant never mixes two studies
+        study = st.query_params.get("study", DEFAULT_STUDY)
+        if study not in STUDIES:
+            # Don't silently record someone under the wrong study
+            st.error(f"Unknown study '{study}'. Please check the link you were given.")
+            st.stop()
+        conditions = STUDIES[study]["conditions"]
+        if not conditions or not set(conditions) <= set(SUPPORTED_CONDITIONS):
+            # Otherwise participants would get cards without any buttons
+            st.error(f"Study '{study}' has unsupported conditions {conditions}; use any of {SUPPORTED_CONDITIONS}.")
+            st.stop()
+        st.session_state.study = study
+
     if 'user_id' not in st.session_state:
         st.session_state.user_id = str(uuid.uuid4())
     
     if 'condition' not in st.session_state:
-        # Randomly assign condition A, B, or C
-        st.session_state.condition = random.choice(['A', 'B', 'C'])
+        # Randomly assign one of the study's conditions (A, B, or C)
+        st.session_state.condition = random.choice(get_study()["conditions"])
         
     if 'current_tweet_index' not in st.session_state:
         st.session_state.current_tweet_index = 0
@@ -66,8 +132,253 @@ def init_session_state():
     if 'verified_ai' not in st.session_state:
         st.session_state.verified_ai = False
 
-def save_response(tweet_data, decision, reason=None):
-    """Appends the response directly to Google Sheets using gspread (Atomic Append)."""
+# --- STORAGE (Google Sheets) ---
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+
+# Tabs the app writes to. None is the first tab (spreadsheet.sheet1).
+WORKSHEETS = [None, "Survey", "Prescreening"]
+
+# Browser-side timings stored with each decision, in ms since the card was displayed.
+# "Displayed" is when the tweet card's DOM appears in the page. For the first card of a
+# session the observer is not installed yet, so there it means "buttons component ready".
+# verified_ms is only set in condition B, first_key_ms and unlocked_ms only in condition C.
+# unlocked_ms is when the justification first reaches the word minimum while typing.
+# verified_ms is NOT a pure human time: it is taken when the page re-renders after
+# verification, so it includes the 3 s wait, the rerun and the network round trip.
+TIMING_COLUMNS = ["first_interaction_ms", "verified_ms", "first_key_ms", "unlocked_ms", "decision_ms"]
+
+# Seconds before a Sheets request is abandoned, so a stuck call can't block saves forever.
+SHEETS_TIMEOUT = 20
+
+# All rows go through one write queue per process, drained by a single writer thread.
+# A failed append is retried with exponential backoff (1s, 2s, 4s, ...).
+WRITE_RETRIES = 4
+# How long a save waits for its write quota and for the writer before giving up.
+WRITE_WAIT_TIMEOUT = 120
+# Per-study token bucket, so one busy study cannot use up the shared Sheets quota.
+DEFAULT_WRITES_PER_MINUTE = 30
+WRITE_BURST = 10
+
+# Set SHEETS_WARMUP=0 to skip the background warm-up (e.g. local dev without secrets).
+WARMUP_ENABLED = os.environ.get("SHEETS_WARMUP", "1") != "0"
+
+@st.cache_resource(show_spinner=False)
+def get_startup_metrics():
+    """Process-wide cold start timings, filled in once each."""
+    return {
+        "script_start": SCRIPT_START,
+        "import": None,        # seconds spent importing gspread + google-auth
+        "first_render": None,  # seconds from first script run to first full render
+        "first_write": None,   # duration of the first successful append, incl. queue/import/auth/open
+    }
+
+def record_startup_metric(metrics, name, seconds):
+    """Stores a startup timing the first time it is seen and prints it to the server log."""
+    if metrics[name] is None:
+        metrics[name] = seconds
+        print(f"[startup] {name}: {seconds:.3f}s")
+
+@st.cache_resource(show_spinner=False)
+def get_sheets_cache():
+    """Process-wide holder for the authenticated client, spreadsheets and opened tabs.
+
+    Shared by every session and every study, so there is one authenticated
+    client per server process; spreadsheets and tabs are keyed by sheet URL
+    so each study still writes only to its own spreadsheet.
+    """
+    return {"lock": threading.Lock(), "client": None, "spreadsheets": {}, "worksheets": {}}
+
+def load_client(cache, secrets, metrics):
+    """Imports gspread and authenticates (once per process)."""
+    if cache["client"] is None:
+        t = time.perf_counter()
+        import gspread
+        from google.oauth2.service_account import Credentials
+        record_startup_metric(metrics, "import", time.perf_counter() - t)
+
+        creds = Credentials.from_service_account_info(secrets, scopes=SCOPES)
+        client = gspread.authorize(creds)
+        client.set_timeout(SHEETS_TIMEOUT)
+        cache["client"] = client
+    return cache["client"]
+
+def load_spreadsheet(cache, secrets, metrics, url):
+    """Opens the spreadsheet at `url` with the shared client (once per process)."""
+    if url not in cache["spreadsheets"]:
+        client = load_client(cache, secrets, metrics)
+        cache["spreadsheets"][url] = client.open_by_url(url)
+    return cache["spreadsheets"][url]
+
+def open_worksheet(cache, secrets, metrics, url, name=None):
+    """Returns the cached tab `name` (None = first tab) of `url`, opening it on first use."""
+    # Cached tabs are read without the lock; only the first open is serialized
+    worksheet = cache["worksheets"].get((url, name))
+    if worksheet is not None:
+        return worksheet
+
+    with cache["lock"]:
+        if (url, name) not in cache["worksheets"]:
+            spreadsheet = load_spreadsheet(cache, secrets, metrics, url)
+            if name is None:
+                cache["worksheets"][url, name] = spreadsheet.sheet1
+            else:
+                cache["worksheets"][url, name] = spreadsheet.worksheet(name)
+        return cache["worksheets"][url, name]
+
+def forget_worksheet(cache, url, name=None):
+    """Drops a cached tab and its spreadsheet so the next save opens them again.
+
+    Lets a renamed/recreated tab or a permission change fix itself without a restart.
+    """
+    with cache["lock"]:
+        cache["worksheets"].pop((url, name), None)
+        cache["spreadsheets"].pop(url, None)
+
+def warmup_sheets(cache, secrets, metrics):
+    """Background job: authenticate and open every tab of every study before anyone saves."""
+    t = time.perf_counter()
+    for study_name, study in STUDIES.items():
+        url = secrets.get(study["spreadsheet"])
+        if url is None:
+            print(f"[startup] sheets warm-up skipped study '{study_name}': no '{study['spreadsheet']}' secret")
+            continue
+        for name in WORKSHEETS:
+            # One failing study/tab must not stop the warm-up of the others.
+            # Not fatal either: the first save will simply retry the open itself.
+            try:
+                open_worksheet(cache, secrets, metrics, url, name)
+            except Exception as e:
+                print(f"[startup] sheets warm-up failed for study '{study_name}', tab {name or 'sheet1'}: {e}")
+    print(f"[startup] sheets warm-up: {time.perf_counter() - t:.3f}s")
+
+@st.cache_resource(show_spinner=False)
+def start_sheets_warmup():
+    """Starts the warm-up thread once per server process."""
+    try:
+        secrets = dict(st.secrets["connections"]["gsheets"])
+    except Exception as e:
+        print(f"[startup] sheets warm-up skipped: {e}")
+        return None
+
+    thread = threading.Thread(
+        target=warmup_sheets,
+        args=(get_sheets_cache(), secrets, get_startup_metrics()),
+        name="sheets-warmup",
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+def write_row(cache, metrics, job):
+    """Appends one queued row, retrying with backoff. Raises after the last attempt."""
+    for attempt in range(WRITE_RETRIES):
+        try:
+            worksheet = open_worksheet(cache, job["secrets"], metrics, job["url"], job["worksheet"])
+            worksheet.append_row(job["row"])
+            return
+        except Exception as e:
+            forget_worksheet(cache, job["url"], job["worksheet"])
+            if attempt == WRITE_RETRIES - 1:
+                raise
+            delay = 2 ** attempt + random.random()
+            print(f"[sheets] write for study '{job['study']}' failed ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+def run_writer(writes, cache, metrics):
+    """Writer thread: sends queued rows one at a time and reports back to the waiting session."""
+    while True:
+        job = writes.get()
+        try:
+            write_row(cache, metrics, job)
+        except Exception as e:
+            job["error"] = e
+        finally:
+            job["done"].set()
+            writes.task_done()
+
+@st.cache_resource(show_spinner=False)
+def get_write_queue():
+    """Process-wide write queue shared by every study, with its writer thread."""
+    writes = queue.Queue()
+    thread = threading.Thread(
+        target=run_writer,
+        args=(writes, get_sheets_cache(), get_startup_metrics()),
+        name="sheets-writer",
+        daemon=True
+    )
+    thread.start()
+    return writes
+
+@st.cache_resource(show_spinner=False)
+def get_write_quotas():
+    """Process-wide token buckets, one per study name."""
+    return {"lock": threading.Lock(), "buckets": {}}
+
+def acquire_write_quota(study_name, timeout):
+    """Takes one write token of the study, waiting for a refill if needed.
+
+    Waits in the calling session only, so a study over its quota never delays the
+    other studies' writes. Raises RuntimeError if no token frees up within `timeout`.
+    """
+    quotas = get_write_quotas()
+    rate = STUDIES[study_name].get("writes_per_minute", DEFAULT_WRITES_PER_MINUTE) / 60
+    deadline = time.monotonic() + timeout
+    while True:
+        with quotas["lock"]:
+            now = time.monotonic()
+            bucket = quotas["buckets"].setdefault(study_name, {"tokens": WRITE_BURST, "updated": now})
+            bucket["tokens"] = min(WRITE_BURST, bucket["tokens"] + (now - bucket["updated"]) * rate)
+            bucket["updated"] = now
+            if bucket["tokens"] >= 1:
+                bucket["tokens"] -= 1
+                return
+            wait = (1 - bucket["tokens"]) / rate
+        if now + wait > deadline:
+            raise RuntimeError(f"Write quota of study '{study_name}' exhausted, please try again.")
+        time.sleep(wait)
+
+def append_row(row_data, worksheet_name=None):
+    """Appends one row to the given tab of the current study's spreadsheet (Atomic Append).
+
+    Takes a token from the study's write quota, puts the row on the shared write
+    queue and waits for the writer, so errors still reach the participant. Raises on failure.
+    """
+    t = time.perf_counter()
+    metrics = get_startup_metrics()
+    study_name = st.session_state.study
+    secrets = st.secrets["connections"]["gsheets"]
+    job = {
+        "study": study_name,
+        "url": secrets[STUDIES[study_name]["spreadsheet"]],
+        "worksheet": worksheet_name,
+        "row": row_data,
+        "secrets": dict(secrets),
+        "done": threading.Event(),
+        "error": None,
+    }
+
+    acquire_write_quota(study_name, WRITE_WAIT_TIMEOUT)
+    get_write_queue().put(job)
+    if not job["done"].wait(WRITE_WAIT_TIMEOUT):
+        raise TimeoutError("The save is still queued and will be written as soon as possible.")
+    if job["error"] is not None:
+        raise job["error"]
+    record_startup_metric(metrics, "first_write", time.perf_counter() - t)
+
+def save_response(tweet_data, decision, reason=None, timing=None):
+    """Appends the response directly to Google Sheets using gspread (Atomic Append).
+
+    `timing` holds the browser-side milliseconds since the card was displayed
+    (see decision_buttons). Missing timings are stored as empty cells.
+    """
+    timing = timing or {}
+    # Time from the server rendering the card to receiving the decision.
+    # Compared with decision_ms this separates server/network latency from the participant's.
+    server_ms = round((time.perf_counter() - st.session_state.card_shown_at) * 1000)
     
     # 1. Prepare the row data as a list (not a DataFrame/dict)
     row_data = [
@@ -78,44 +389,58 @@ def save_response(tweet_data, decision, reason=None):
         tweet_data['text'],
         tweet_data['ai_suggestion'],
         decision,
-        reason if reason else "N/A"
+        reason if reason else "N/A",
+        # Numeric timing columns (ms since card display)
+        *["" if timing.get(k) is None else timing[k] for k in TIMING_COLUMNS],
+        server_ms,
+        st.session_state.study
     ]
     
     # 2. Update Session State (for UI feedback only)
     st.session_state.responses.append({
         "user_id": row_data[0], "timestamp": row_data[1], "condition": row_data[2],
         "tweet_id": row_data[3], "tweet_text": row_data[4], "ai_suggestion": row_data[5],
-        "user_decision": row_data[6], "reason": row_data[7]
+        "user_decision": row_data[6], "reason": row_data[7],
+        **{k: timing.get(k) for k in TIMING_COLUMNS}, "server_ms": server_ms,
+        "study": st.session_state.study
     })
 
     try:
-        # 3. Load Secrets manually
-        # We access the same secrets you set up for the connection
-        secrets = st.secrets["connections"]["gsheets"]
-        
-        # 4. Authenticate directly
-        # We assume the secrets are inside the "connections.gsheets" block
-        creds = Credentials.from_service_account_info(
-            secrets,
-            scopes=[
-                "https://www.googleapis.com/auth/spreadsheets",
-                "https://www.googleapis.com/auth/drive"
-            ]
-        )
-        client = gspread.authorize(creds)
-        
-        # 5. Open the Sheet
-        # Use the URL found in your secrets file
-        spreadsheet = client.open_by_url(secrets["spreadsheet"])
-        worksheet = spreadsheet.sheet1 # Targets the first tab
-        
-        # 6. Append the Row
-        # This is the magic command. It just adds data to the bottom.
-        worksheet.append_row(row_data)
+        # 3. Append the Row to the first tab
+        # The client and worksheet are cached per process (see get_sheets_cache)
+        append_row(row_data)
         
     except Exception as e:
         st.error(f"Error saving to Google Sheets: {e}")
 
+def card_id(tweet):
+    """Identifies one tweet card of one participant (used to match browser timings)."""
+    return f"{st.session_state.user_id}-{tweet['id']}"
+
+def decision_buttons(tweet, disabled=False, show=True, verified=False, min_words=None):
+    """Renders the Reject/Approve buttons and times the decision in the browser.
+
+    Pass `min_words` in condition C so the unlock is timed from the typing itself.
+    Returns None until a button is clicked, then
+    {"decision": "Reject" | "Approve", "click_id": ..., "timing": {<TIMING_COLUMNS>: ms or None}}.
+    A click dropped with reject_click() is never returned again.
+    """
+    rejected_click = st.session_state.get(f"rejected_click_{tweet['id']}")
+    result = _decision_buttons(
+        card=card_id(tweet), disabled=disabled, show=show, verified=verified, min_words=min_words,
+        rejected_click=rejected_click, key=f"decision_{tweet['id']}", default=None
+    )
+    if result and result.get("decision") in ("Reject", "Approve") and result.get("click_id") != rejected_click:
+        return result
+    return None
+
+def reject_click(tweet, clicked):
+    """Drops a click the server could not accept and re-renders so the buttons come back."""
+    # The component keeps its last value under its key, so remember the click
+    # instead of clearing it; the browser re-enables the buttons when it sees it here.
+    st.session_state[f"rejected_click_{tweet['id']}"] = clicked["click_id"]
+    st.rerun()
+
 def save_survey_results(answers):
     """Saves the Likert scale answers to the 'Survey' tab."""
     row_data = [
@@ -123,24 +448,13 @@ def save_survey_results(answers):
         datetime.now().isoformat(),
         st.session_state.condition,
         answers[0], answers[1], answers[2], 
-        answers[3], answers[4], answers[5]
+        answers[3], answers[4], answers[5],
+        st.session_state.study
     ]
 
     try:
-        # Load secrets and auth (same as before)
-        secrets = st.secrets["connections"]["gsheets"]
-        creds = Credentials.from_service_account_info(
-            secrets,
-            scopes=["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
-        )
-        client = gspread.authorize(creds)
-        
-        # Open the specific 'Survey' tab
-        spreadsheet = client.open_by_url(secrets["spreadsheet"])
         # CAREFUL: Make sure you created a tab named "Survey" in your Google Sheet!
-        worksheet = spreadsheet.worksheet("Survey") 
-        
-        worksheet.append_row(row_data)
+        append_row(row_data, "Survey")
         
     except Exception as e:
         st.error(f"Error saving survey: {e}")
@@ -155,22 +469,13 @@ def save_prescreening(age, gender, profession, field, likert_ans, freq_usage, fr
         st.session_state.condition,
         age, gender, profession, field,
         likert_ans[0], likert_ans[1], likert_ans[2], # The 3 Likert answers
-        freq_usage, freq_verify
+        freq_usage, freq_verify,
+        st.session_state.study
     ]
 
     try:
-        secrets = st.secrets["connections"]["gsheets"]
-        creds = Credentials.from_service_account_info(
-            secrets,
-            scopes=["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
-        )
-        client = gspread.authorize(creds)
-        
-        spreadsheet = client.open_by_url(secrets["spreadsheet"])
         # Ensure you created this tab in your Google Sheet!
-        worksheet = spreadsheet.worksheet("Prescreening")
-        
-        worksheet.append_row(row_data)
+        append_row(row_data, "Prescreening")
         
     except Exception as e:
         st.error(f"Error saving Prescreening: {e}")
@@ -182,7 +487,7 @@ def next_tweet():
     # Reset specific friction states
     st.session_state.verified_ai = False
     
-    if st.session_state.current_tweet_index >= len(TWEETS):
+    if st.session_state.current_tweet_index >= len(get_tweets()):
         st.session_state.experiment_complete = True
     st.rerun()
 
@@ -317,10 +622,16 @@ def render_prescreening():
 
 def render_tweet_card(tweet):
     """Displays the tweet and the AI suggestion."""
+
+    # Server-side reference point for server_ms (once per card, not per rerun)
+    if st.session_state.get('card_shown_for') != st.session_state.current_tweet_index:
+        st.session_state.card_shown_for = st.session_state.current_tweet_index
+        st.session_state.card_shown_at = time.perf_counter()
     
     # Progress bar
-    progress = st.session_state.current_tweet_index / len(TWEETS)
-    st.progress(progress, text=f"Tweet {st.session_state.current_tweet_index + 1} of {len(TWEETS)}")
+    tweets = get_tweets()
+    progress = st.session_state.current_tweet_index / len(tweets)
+    st.progress(progress, text=f"Tweet {st.session_state.current_tweet_index + 1} of {len(tweets)}")
 
     st.info(
         "**Task:** Evaluate if the **AI Suggestion** is correct.\n\n"
@@ -331,7 +642,7 @@ def render_tweet_card(tweet):
     st.markdown("### Tweet Content")
     st.markdown(
         f"""
-        <div style="padding: 20px; border-radius: 10px; background-color: #000000; border: 1px solid #d0d7de; margin-bottom: 20px;">
+        <div data-card="{card_id(tweet)}" style="padding: 20px; border-radius: 10px; background-color: #000000; border: 1px solid #d0d7de; margin-bottom: 20px;">
             <p style="font-size: 18px; font-family: sans-serif;">{tweet['text']}</p>
         </div>
         """, 
@@ -346,15 +657,10 @@ def render_tweet_card(tweet):
 def render_controls_condition_A(tweet):
     """Low Friction: Instant Action."""
     st.subheader("Action")
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("Reject AI suggestion", use_container_width=True):
-            save_response(tweet, "Reject")
-            next_tweet()
-    with col2:
-        if st.button("Approve AI suggestion", use_container_width=True):
-            save_response(tweet, "Approve")
-            next_tweet()
+    clicked = decision_buttons(tweet)
+    if clicked:
+        save_response(tweet, clicked["decision"], timing=clicked["timing"])
+        next_tweet()
 
 def render_controls_condition_B(tweet):
     """Placebo Friction: Fake Verification Wait."""
@@ -368,19 +674,16 @@ def render_controls_condition_B(tweet):
                 time.sleep(3) # The 3-second friction
             st.session_state.verified_ai = True
             st.rerun()
+        # Hidden, but already timing from when the card was displayed
+        decision_buttons(tweet, show=False)
             
     # Step 2: Show buttons only after verification
     else:
         st.success("Verification Complete. Please select an action.")
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("Reject AI suggestion", use_container_width=True):
-                save_response(tweet, "Reject")
-                next_tweet()
-        with col2:
-            if st.button("Approve AI suggestion", use_container_width=True):
-                save_response(tweet, "Approve")
-                next_tweet()
+        clicked = decision_buttons(tweet, verified=True)
+        if clicked:
+            save_response(tweet, clicked["decision"], timing=clicked["timing"])
+            next_tweet()
 
 def render_controls_condition_C(tweet):
     """High Friction: Free Text Justification (Min 5 words)."""
@@ -413,18 +716,13 @@ def render_controls_condition_C(tweet):
     else:
         st.success("✅ Length requirement met.")
 
-    col1, col2 = st.columns(2)
-    with col1:
-        # Button: Reject AI
-        if st.button("Reject AI suggestion", disabled=is_disabled, use_container_width=True):
-            save_response(tweet, "Reject", reason)
-            next_tweet()
-            
-    with col2:
-        # Button: Approve AI
-        if st.button("Approve AI suggestion", disabled=is_disabled, use_container_width=True):
-            save_response(tweet, "Approve", reason)
-            next_tweet()
+    clicked = decision_buttons(tweet, disabled=is_disabled, min_words=min_words)
+    if clicked:
+        if is_disabled:
+            # The text was cut below the minimum in the same rerun as the click
+            reject_click(tweet, clicked)
+        save_response(tweet, clicked["decision"], reason, timing=clicked["timing"])
+        next_tweet()
 
 def render_survey():
     st.title("Post-Experiment Survey")
@@ -662,6 +960,11 @@ def main():
     st.set_page_config(page_title="Moderation Experiment", page_icon="⚖️")
     init_session_state()
 
+    # Authenticate and open all tabs in the background while the participant
+    # reads the intro, so the first save does not pay for it.
+    if WARMUP_ENABLED:
+        start_sheets_warmup()
+
     # Router
     if st.session_state.survey_complete:
         st.balloons()
@@ -684,7 +987,7 @@ def main():
 
     else:
         # Experiment Loop
-        current_tweet = TWEETS[st.session_state.current_tweet_index]
+        current_tweet = get_tweets()[st.session_state.current_tweet_index]
 
         render_policy_helper()
         
@@ -698,5 +1001,8 @@ def main():
         elif st.session_state.condition == 'C':
             render_controls_condition_C(current_tweet)
 
+    metrics = get_startup_metrics()
+    record_startup_metric(metrics, "first_render", time.perf_counter() - metrics["script_start"])
+
 if __name__ == "__main__":
     main()
\ No newline at end of file